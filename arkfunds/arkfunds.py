@@ -1,10 +1,36 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+from .utils import _encode_query, get_useragent
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
-from .utils import get_useragent
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class ArkFunds:
-    ARK_FUNDS = ["ARKF", "ARKG", "ARKK", "ARKQ", "ARKW", "ARKX", "IZRL", "PRNT"]
+    _ARK_FUNDS_ORDER = ("ARKF", "ARKG", "ARKK", "ARKQ", "ARKW", "ARKX", "IZRL", "PRNT")
+    ARK_FUNDS = frozenset(_ARK_FUNDS_ORDER)
     BASE_URL = "https://arkfunds.io/api/v1"
     ENDPOINTS = {
         "etf": {
@@ -20,22 +46,381 @@ class ArkFunds:
         },
     }
 
+    # Seconds a fetched payload is reused before the endpoint is queried again.
+    # Set to 0 to disable caching
+    CACHE_TTL = 60
+
+    # Fan out per-symbol requests with aiohttp instead of the thread pool.
+    # Requires the async extra; the shared session's retries do not apply.
+    USE_ASYNC = False
+
+    # Endpoints with large payloads, parsed incrementally while the body
+    # arrives when ijson is installed and the response is not small
+    _STREAM_ENDPOINTS = ("holdings", "trades")
+    _STREAM_MIN_SIZE = 64 * 1024
+    # JSON typically compresses 5-10x, so the wire size of a compressed
+    # body is scaled up before it is compared against _STREAM_MIN_SIZE
+    _STREAM_COMPRESSION_RATIO = 8
+
+    # Whether (key, endpoint) is known to answer comma-separated symbols:
+    # False once it rejects a batch, True once a batch returns several symbols
+    _BATCH_SUPPORT = {}
+
+    _CACHE = {}
+    _SESSION = None
+    _SESSION_LOCK = threading.Lock()
+
     def __init__(self, symbols):
         self.symbols = symbols
         self.timeout = 2
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": get_useragent(__class__.__name__)})
-
-    def _get(self, params):
-        res = self.session.get(
-            self.BASE_URL + self.ENDPOINTS[params["key"]][params["endpoint"]],
-            params=params["query"],
-            timeout=self.timeout,
+        self.session = self._get_session()
+
+    @classmethod
+    def _get_session(cls):
+        """Return the connection-pooled session shared by all instances"""
+        if ArkFunds._SESSION is None:
+            with ArkFunds._SESSION_LOCK:
+                if ArkFunds._SESSION is None:
+                    # raise_on_status=False hands the last response back so
+                    # raise_for_status() still raises HTTPError, not RetryError
+                    retry = Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[502, 503, 504],
+                        raise_on_status=False,
+                    )
+                    adapter = HTTPAdapter(
+                        pool_connections=32, pool_maxsize=32, max_retries=retry
+                    )
+
+                    session = requests.Session()
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    # requests already advertises br/zstd when their decoders
+                    # are installed, so Accept-Encoding is left at its default
+                    session.headers.update(
+                        {"User-Agent": get_useragent(__class__.__name__)}
+                    )
+
+                    ArkFunds._SESSION = session
+
+        return ArkFunds._SESSION
+
+    def _build_dataframe(self, rows, endpoint, **values):
+        """Build a typed DataFrame from endpoint records
+
+        Args:
+            rows (list): Records as dicts or tuples in column order
+            endpoint (str): Endpoint the records were fetched from
+            **values: Column values replacing those found in the records
+
+        Returns:
+            pandas.DataFrame
+        """
+        df = pd.DataFrame.from_records(rows, columns=self._COLUMN_INDEX[endpoint])
+        for column, value in values.items():
+            df[column] = value
+
+        df = df.astype(self._DTYPES[endpoint], copy=False)
+
+        if "date" in df.columns:
+            df["date"] = pd.to_datetime(df["date"], cache=True)
+
+        return df
+
+    def _cache_key(self, key, endpoint, query):
+        return (key, endpoint, tuple(sorted(_encode_query(query))))
+
+    def _cache_get(self, cache_key):
+        """Return the cached ``(timestamp, payload)`` entry unless it has expired"""
+        entry = ArkFunds._CACHE.get(cache_key)
+
+        if entry and time.monotonic() - entry[0] < self.CACHE_TTL:
+            return entry
+
+        return None
+
+    def _cache_set(self, cache_key, data):
+        """Store a payload, dropping expired entries so the cache stays bounded"""
+        if self.CACHE_TTL <= 0:
+            return
+
+        now = time.monotonic()
+        for k, (timestamp, _) in list(ArkFunds._CACHE.items()):
+            if now - timestamp >= self.CACHE_TTL:
+                ArkFunds._CACHE.pop(k, None)
+
+        ArkFunds._CACHE[cache_key] = (now, data)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached payloads, forcing the next calls to refetch"""
+        ArkFunds._CACHE.clear()
+
+    def _stream(self, endpoint, content_length=None, content_encoding=None):
+        """Whether a response body should be parsed incrementally with ijson
+
+        Args:
+            endpoint (str): Endpoint being fetched
+            content_length (str or int, optional): Response size on the wire,
+                if known. Defaults to None, which counts as a large response.
+            content_encoding (str, optional): Response Content-Encoding.
+                Defaults to None.
+        """
+        if ijson is None or endpoint not in self._STREAM_ENDPOINTS:
+            return False
+
+        if content_length is None:
+            return True
+
+        size = int(content_length)
+        if content_encoding and content_encoding != "identity":
+            size *= self._STREAM_COMPRESSION_RATIO
+
+        return size >= self._STREAM_MIN_SIZE
+
+    def _prepare(self, key, endpoint, query):
+        """Prepare a GET request for an endpoint
+
+        Returns:
+            tuple: ``(PreparedRequest, settings)``, where settings are the
+            keyword arguments for ``Session.send``
+        """
+        url = self.BASE_URL + self.ENDPOINTS[key][endpoint]
+        prepared = self.session.prepare_request(
+            requests.Request("GET", url, params=query)
+        )
+        settings = self.session.merge_environment_settings(
+            prepared.url, {}, self._stream(endpoint), None, None
         )
 
-        if res.status_code == 404:
+        return prepared, settings
+
+    def _get(self, key, endpoint, query, symbol=None, template=None):
+        """Fetch an endpoint, optionally for a single symbol
+
+        Args:
+            template (tuple, optional): Result of ``_prepare`` for the same
+                endpoint, used by the thread fan-out. Only the URL and cookies
+                are re-prepared, skipping header and environment merging.
+                Defaults to None.
+        """
+        if symbol is not None:
+            query = {**query, "symbol": symbol}
+
+        cache_key = self._cache_key(key, endpoint, query)
+        entry = self._cache_get(cache_key)
+
+        if entry:
+            return entry[1]
+
+        url = self.BASE_URL + self.ENDPOINTS[key][endpoint]
+        stream = self._stream(endpoint)
+
+        if template:
+            prepared, settings = template
+            prepared = prepared.copy()
+            prepared.prepare_url(url, _encode_query(query))
+            # Cookies are matched against the URL and the jar may have changed
+            # since the template was prepared
+            prepared.headers.pop("Cookie", None)
+            prepared.prepare_cookies(self.session.cookies)
+            res = self.session.send(prepared, timeout=self.timeout, **settings)
+        else:
+            res = self.session.get(
+                url, params=query, timeout=self.timeout, stream=stream
+            )
+
+        with res:
+            if res.status_code == 404:
+                data = None
+            else:
+                res.raise_for_status()
+
+                if stream and self._stream(
+                    endpoint,
+                    res.headers.get("Content-Length"),
+                    res.headers.get("Content-Encoding"),
+                ):
+                    data = self._read_stream(res)
+                elif orjson:
+                    data = orjson.loads(res.content)
+                else:
+                    data = res.json()
+
+        self._cache_set(cache_key, data)
+
+        return data
+
+    def _read_stream(self, res):
+        """Parse a streamed response body incrementally with ijson
+
+        Reading ``res.raw`` bypasses requests, so transport and parse errors
+        are converted to the exceptions ``res.json()`` would have raised.
+        """
+        res.raw.decode_content = True
+
+        try:
+            return dict(ijson.kvitems(res.raw, "", use_float=True))
+        except ProtocolError as e:
+            raise requests.ConnectionError(e, request=res.request) from e
+        except ReadTimeoutError as e:
+            raise requests.ReadTimeout(e, request=res.request) from e
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(
+                e, request=res.request
+            ) from e
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in response from {res.url}: {e}") from e
+
+    def _get_batch(self, key, endpoint, query, symbols):
+        """Fetch an endpoint for all symbols in a single request
+
+        Returns:
+            dict: Response payload, or None if the endpoint rejects batching
+        """
+        if ArkFunds._BATCH_SUPPORT.get((key, endpoint)) is False:
+            return None
+
+        try:
+            return self._get(key, endpoint, query, symbol=",".join(symbols))
+        except requests.HTTPError as e:
+            if e.response is not None and 400 <= e.response.status_code < 500:
+                ArkFunds._BATCH_SUPPORT[(key, endpoint)] = False
+                return None
+            raise
+
+    def _batch_missing(self, key, endpoint, df, symbols):
+        """Symbols a batched response still has to be fetched for one by one
+
+        Symbols without rows are refetched individually until the endpoint
+        has returned several symbols in one batch. After that, a symbol
+        without rows simply has none (e.g. a fund that did not trade today).
+
+        Returns:
+            list: Symbols to fetch individually, or None if the batch can't
+            be used because it holds no or unrequested symbols
+        """
+        found = set(df[self._BATCH_KEYS[endpoint]])
+        if not found <= set(symbols):
             return None
 
-        res.raise_for_status()
+        if len(found) > 1:
+            ArkFunds._BATCH_SUPPORT[(key, endpoint)] = True
+
+        if ArkFunds._BATCH_SUPPORT.get((key, endpoint)):
+            return []
+
+        if not found:
+            return None
+
+        return [symbol for symbol in symbols if symbol not in found]
+
+    async def _aget(self, session, key, endpoint, query, symbol=None):
+        if symbol is not None:
+            query = {**query, "symbol": symbol}
+
+        cache_key = self._cache_key(key, endpoint, query)
+        entry = self._cache_get(cache_key)
+
+        if entry:
+            return entry[1]
+
+        async with session.get(
+            self.BASE_URL + self.ENDPOINTS[key][endpoint],
+            params=_encode_query(query),
+        ) as res:
+            if res.status == 404:
+                data = None
+            else:
+                res.raise_for_status()
+
+                if self._stream(
+                    endpoint, res.content_length, res.headers.get("Content-Encoding")
+                ):
+                    try:
+                        data = {
+                            k: v
+                            async for k, v in ijson.kvitems_async(
+                                res.content, "", use_float=True
+                            )
+                        }
+                    except ijson.JSONError as e:
+                        raise ValueError(
+                            f"Invalid JSON in response from {res.url}: {e}"
+                        ) from e
+                elif orjson:
+                    data = orjson.loads(await res.read())
+                else:
+                    data = await res.json()
+
+        self._cache_set(cache_key, data)
+
+        return data
+
+    async def _aget_all(self, key, endpoint, query, symbols):
+        # aiohttp sessions are bound to the running event loop, so each
+        # fan-out opens its own session rather than keeping one on the instance
+        async with aiohttp.ClientSession(
+            # Only the User-Agent is shared; aiohttp sets an Accept-Encoding
+            # matching the decoders it has available
+            headers={"User-Agent": self.session.headers["User-Agent"]},
+            # Per connect/read like requests' timeout, not for the whole body
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.timeout, sock_read=self.timeout
+            ),
+            trust_env=True,
+        ) as session:
+            return await asyncio.gather(
+                *[self._aget(session, key, endpoint, query, s) for s in symbols]
+            )
+
+    def _run_async(self, key, endpoint, query, symbols):
+        """Run the aiohttp fan-out, raising the same exceptions as requests"""
+        try:
+            return asyncio.run(self._aget_all(key, endpoint, query, symbols))
+        except aiohttp.ClientResponseError as e:
+            # Callers check e.response.status_code, as with raise_for_status()
+            response = requests.Response()
+            response.status_code = e.status
+            response.reason = e.message
+            response.url = str(e.request_info.real_url)
+            response.headers.update(e.headers or {})
+
+            raise requests.HTTPError(
+                f"{e.status} Error: {e.message} for url: {response.url}",
+                response=response,
+            ) from e
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(e) from e
+        except aiohttp.ClientConnectionError as e:
+            raise requests.ConnectionError(e) from e
+        except aiohttp.ClientError as e:
+            raise requests.RequestException(e) from e
+
+    def _get_all(self, key, endpoint, query, symbols):
+        """Fetch an endpoint for each symbol concurrently
+
+        Returns:
+            list: Response payloads, in the same order as ``symbols``
+        """
+        if not symbols:
+            return []
+
+        if self.USE_ASYNC and aiohttp:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return self._run_async(key, endpoint, query, symbols)
+
+        # Fan out on threads through the shared session; requests releases
+        # the GIL on I/O. Also used inside a running event loop (e.g. Jupyter)
+        template = self._prepare(key, endpoint, query)
 
-        return res.json()
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+            return list(
+                executor.map(
+                    partial(self._get, key, endpoint, query, template=template),
+                    symbols,
+                )
+            )
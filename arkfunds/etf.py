@@ -1,9 +1,10 @@
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
 from .arkfunds import ArkFunds
-from .utils import _convert_to_list
+from .utils import STRING_DTYPE, _convert_to_list
 
 
 class ETF(ArkFunds):
@@ -53,6 +54,55 @@ class ETF(ArkFunds):
         ],
     }
 
+    _COLUMN_INDEX = {
+        endpoint: pd.Index(columns) for endpoint, columns in _COLUMNS.items()
+    }
+
+    _DTYPES = {
+        "profile": {
+            "symbol": STRING_DTYPE,
+            "name": STRING_DTYPE,
+            "description": STRING_DTYPE,
+            "fund_type": STRING_DTYPE,
+            "cusip": STRING_DTYPE,
+            "isin": STRING_DTYPE,
+            "website": STRING_DTYPE,
+        },
+        "holdings": {
+            "fund": STRING_DTYPE,
+            "company": STRING_DTYPE,
+            "ticker": STRING_DTYPE,
+            "cusip": STRING_DTYPE,
+            "shares": "float64",
+            "market_value": "float64",
+            "weight": "float64",
+        },
+        "trades": {
+            "fund": STRING_DTYPE,
+            "direction": STRING_DTYPE,
+            "ticker": STRING_DTYPE,
+            "company": STRING_DTYPE,
+            "cusip": STRING_DTYPE,
+            "shares": "float64",
+            "etf_percent": "float64",
+        },
+        "news": {
+            "related": STRING_DTYPE,
+            "source": STRING_DTYPE,
+            "headline": STRING_DTYPE,
+            "summary": STRING_DTYPE,
+            "url": STRING_DTYPE,
+            "image": STRING_DTYPE,
+        },
+    }
+
+    # Endpoints accepting comma-separated symbols, mapped to the column
+    # identifying which symbol each returned row belongs to
+    _BATCH_KEYS = {
+        "holdings": "fund",
+        "trades": "fund",
+    }
+
     def __init__(self, symbols: str):
         """Initialize
 
@@ -76,30 +126,53 @@ class ETF(ArkFunds):
         self.symbols = valid_symbols
         self.invalid_symbols = invalid_symbols or None
 
-    def _dataframe(self, symbols, params):
-        endpoint = params["endpoint"]
-        columns = self._COLUMNS[endpoint]
-        dataframes = []
-
+    def _dataframe(self, symbols, key, endpoint, query):
         if not self.symbols:
-            return f"ETF.{endpoint}: Invalid symbols {self.invalid_symbols}. Symbols accepted: {', '.join(self.ARK_FUNDS)}"
+            return f"ETF.{endpoint}: Invalid symbols {self.invalid_symbols}. Symbols accepted: {', '.join(self._ARK_FUNDS_ORDER)}"
         else:
-            for symbol in symbols:
-                params["query"]["symbol"] = symbol
-                data = self._get(params)
-
-                df = pd.DataFrame(data[endpoint], columns=columns)
-
-                if endpoint == "holdings":
-                    df["fund"] = symbol
-                    df["date"] = data.get("date")
-
-                if endpoint == "trades":
-                    df["fund"] = symbol
-
-                dataframes.append(df)
-
-            return pd.concat(dataframes, axis=0).reset_index(drop=True)
+            batch = None
+            if len(symbols) > 1 and endpoint in self._BATCH_KEYS:
+                data = self._get_batch(key, endpoint, query, symbols)
+
+                if data is not None:
+                    df = self._build_dataframe(data[endpoint], endpoint)
+
+                    # Rows without their own holdings date take the payload's
+                    if endpoint == "holdings" and data.get("date"):
+                        df["date"] = df["date"].fillna(pd.to_datetime(data["date"]))
+
+                    missing = self._batch_missing(key, endpoint, df, symbols)
+                    if missing is not None:
+                        if not missing:
+                            return df
+                        batch, symbols = df, missing
+
+            rows = []
+            counts = []
+            dates = []
+            for data in self._get_all(key, endpoint, query, symbols):
+                records = data[endpoint]
+                if not isinstance(records, list):
+                    records = [records]
+
+                rows.extend(records)
+                counts.append(len(records))
+                dates.append(data.get("date"))
+
+            # Tag rows with their fund (and holdings date) column-wise,
+            # rather than copying every record into a new dict
+            values = {}
+            if endpoint in ("holdings", "trades"):
+                values["fund"] = np.repeat(symbols, counts)
+            if endpoint == "holdings":
+                values["date"] = np.repeat(dates, counts)
+
+            df = self._build_dataframe(rows, endpoint, **values)
+
+            if batch is not None:
+                df = pd.concat([batch, df], ignore_index=True)
+
+            return df
 
     def profile(self):
         """Get ARK ETF profile information
@@ -107,13 +180,7 @@ class ETF(ArkFunds):
         Returns:
             pandas.DataFrame
         """
-        params = {
-            "key": "etf",
-            "endpoint": "profile",
-            "query": {},
-        }
-
-        return self._dataframe(self.symbols, params)
+        return self._dataframe(self.symbols, key="etf", endpoint="profile", query={})
 
     def holdings(self, _date: date = None):
         """Get ARK ETF holdings
@@ -124,15 +191,13 @@ class ETF(ArkFunds):
         Returns:
             pandas.DataFrame
         """
-        params = {
-            "key": "etf",
-            "endpoint": "holdings",
-            "query": {
-                "date": _date,
-            },
-        }
+        query = {}
+        if _date:
+            query["date"] = _date
 
-        return self._dataframe(self.symbols, params)
+        return self._dataframe(
+            self.symbols, key="etf", endpoint="holdings", query=query
+        )
 
     def trades(self, period: str = "1d"):
         """Get ARK ETF intraday trades
@@ -143,15 +208,11 @@ class ETF(ArkFunds):
         Returns:
             pandas.DataFrame
         """
-        params = {
-            "key": "etf",
-            "endpoint": "trades",
-            "query": {
-                "period": period,
-            },
+        query = {
+            "period": period,
         }
 
-        return self._dataframe(self.symbols, params)
+        return self._dataframe(self.symbols, key="etf", endpoint="trades", query=query)
 
     def news(self, date_from: date = None, date_to: date = None):
         """Get ARK ETF news
@@ -163,13 +224,10 @@ class ETF(ArkFunds):
         Returns:
             pandas.DataFrame
         """
-        params = {
-            "key": "etf",
-            "endpoint": "news",
-            "query": {
-                "date_from": date_from,
-                "date_to": date_to,
-            },
-        }
+        query = {}
+        if date_from:
+            query["date_from"] = date_from
+        if date_to:
+            query["date_to"] = date_to
 
-        return self._dataframe(self.symbols, params)
+        return self._dataframe(self.symbols, key="etf", endpoint="news", query=query)
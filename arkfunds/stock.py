@@ -1,9 +1,10 @@
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
 from .arkfunds import ArkFunds
-from .utils import _convert_to_list
+from .utils import STRING_DTYPE, _convert_to_list
 from .yahoo import YahooFinance
 
 
@@ -47,6 +48,47 @@ class Stock(ArkFunds):
         ],
     }
 
+    _COLUMN_INDEX = {
+        endpoint: pd.Index(columns) for endpoint, columns in _COLUMNS.items()
+    }
+
+    _DTYPES = {
+        "profile": {
+            "ticker": STRING_DTYPE,
+            "name": STRING_DTYPE,
+            "country": STRING_DTYPE,
+            "industry": STRING_DTYPE,
+            "sector": STRING_DTYPE,
+            "summary": STRING_DTYPE,
+            "website": STRING_DTYPE,
+            "market": STRING_DTYPE,
+            "exchange": STRING_DTYPE,
+            "currency": STRING_DTYPE,
+        },
+        "ownership": {
+            "ticker": STRING_DTYPE,
+            "fund": STRING_DTYPE,
+            "weight": "float64",
+            "shares": "float64",
+            "market_value": "float64",
+        },
+        "trades": {
+            "fund": STRING_DTYPE,
+            "direction": STRING_DTYPE,
+            "ticker": STRING_DTYPE,
+            "company": STRING_DTYPE,
+            "cusip": STRING_DTYPE,
+            "shares": "float64",
+            "etf_percent": "float64",
+        },
+    }
+
+    # Endpoints accepting comma-separated symbols, mapped to the column
+    # identifying which symbol each returned row belongs to
+    _BATCH_KEYS = {
+        "trades": "ticker",
+    }
+
     def __init__(self, symbols: str):
         """Initialize
 
@@ -61,31 +103,53 @@ class Stock(ArkFunds):
         except Exception:
             self.yf = None
 
-    def _dataframe(self, symbols, params):
-        endpoint = params["endpoint"]
-        columns = self._COLUMNS[endpoint]
-        dataframes = []
-
-        for symbol in symbols:
-            params["query"]["symbol"] = symbol
-            data = self._get(params)
+    def _dataframe(self, symbols, key, endpoint, query):
+        batch = None
+        if len(symbols) > 1 and endpoint in self._BATCH_KEYS:
+            data = self._get_batch(key, endpoint, query, symbols)
 
             if data:
-                if endpoint == "profile":
-                    df = pd.DataFrame(data, columns=columns, index=[0])
-                else:
-                    df = pd.DataFrame(data[endpoint], columns=columns)
+                df = self._build_dataframe(data[endpoint], endpoint)
 
-                if endpoint == "ownership":
-                    df["ticker"] = data.get("symbol")
-                    df["date"] = data.get("date")
+                missing = self._batch_missing(key, endpoint, df, symbols)
+                if missing is not None:
+                    if not missing:
+                        return df
+                    batch, symbols = df, missing
 
-                dataframes.append(df)
+        payloads = [
+            data for data in self._get_all(key, endpoint, query, symbols) if data
+        ]
 
-        if not dataframes:
+        if not payloads:
+            if batch is not None:
+                return batch
             return f"Stock.{endpoint}: No data found for {symbols}"
-        else:
-            return pd.concat(dataframes, axis=0).reset_index(drop=True)
+
+        if endpoint == "ownership":
+            return self._handle_ownership_data(payloads)
+
+        rows = []
+        for data in payloads:
+            rows.extend([data] if endpoint == "profile" else data[endpoint])
+
+        df = self._build_dataframe(rows, endpoint)
+
+        if batch is not None:
+            df = pd.concat([batch, df], ignore_index=True)
+
+        return df
+
+    def _handle_ownership_data(self, payloads):
+        rows = [row for data in payloads for row in data["ownership"]]
+        counts = [len(data["ownership"]) for data in payloads]
+
+        return self._build_dataframe(
+            rows,
+            "ownership",
+            ticker=np.repeat([data.get("symbol") for data in payloads], counts),
+            date=np.repeat([data.get("date") for data in payloads], counts),
+        )
 
     def profile(self):
         """Get Stock profile information
@@ -93,13 +157,7 @@ class Stock(ArkFunds):
         Returns:
             dict
         """
-        params = {
-            "key": "stock",
-            "endpoint": "profile",
-            "query": {},
-        }
-
-        return self._dataframe(self.symbols, params)
+        return self._dataframe(self.symbols, key="stock", endpoint="profile", query={})
 
     def fund_ownership(self):
         """Get Stock Fund Ownership
@@ -107,13 +165,9 @@ class Stock(ArkFunds):
         Returns:
             pandas.DataFrame
         """
-        params = {
-            "key": "stock",
-            "endpoint": "ownership",
-            "query": {},
-        }
-
-        return self._dataframe(self.symbols, params)
+        return self._dataframe(
+            self.symbols, key="stock", endpoint="ownership", query={}
+        )
 
     def trades(
         self, direction: str = None, date_from: date = None, date_to: date = None
@@ -128,17 +182,17 @@ class Stock(ArkFunds):
         Returns:
             pandas.DataFrame
         """
-        params = {
-            "key": "stock",
-            "endpoint": "trades",
-            "query": {
-                "direction": [direction.lower() if direction else None],
-                "date_from": date_from,
-                "date_to": date_to,
-            },
-        }
-
-        return self._dataframe(self.symbols, params)
+        query = {}
+        if direction:
+            query["direction"] = direction.lower()
+        if date_from:
+            query["date_from"] = date_from
+        if date_to:
+            query["date_to"] = date_to
+
+        return self._dataframe(
+            self.symbols, key="stock", endpoint="trades", query=query
+        )
 
     def price(self):
         """Get current stock price info
@@ -1,19 +1,53 @@
+import functools
 import importlib.metadata
 import re
 
 
+@functools.lru_cache(maxsize=1)
+def _ark_version():
+    return importlib.metadata.version("arkfunds")
+
+
 def get_useragent(client, agent="Mozilla/5.0"):
     if client == "ArkFunds":
-        ver = importlib.metadata.version("arkfunds")
+        ver = _ark_version()
         agent = f"python-arkfunds/{ver}"
 
     return agent
 
 
+try:
+    import pyarrow  # noqa: F401
+
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+_SYMBOL_RE = re.compile(r"[\w\-.=^&]+")
+
+
 def _convert_to_list(symbols, comma_split=False):
     if isinstance(symbols, str):
+        symbols = symbols.upper()
         if comma_split:
-            return [x.strip() for x in symbols.upper().split(",")]
+            symbols = [x.strip() for x in symbols.split(",")]
+        elif symbols.replace(",", "").replace(" ", "").isalnum():
+            symbols = symbols.replace(",", " ").split()
         else:
-            return re.findall(r"[\w\-.=^&]+", symbols.upper())
-    return [symbol.upper() for symbol in symbols]
+            symbols = _SYMBOL_RE.findall(symbols)
+    else:
+        symbols = [symbol.upper() for symbol in symbols]
+
+    # Drop duplicates while keeping the order symbols were given in
+    return list(dict.fromkeys(symbols))
+
+
+def _encode_query(query):
+    # Mirror how requests encodes query params: None values are dropped and
+    # list values are expanded into repeated keys
+    items = []
+    for key, value in query.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((key, str(v)) for v in values if v is not None)
+
+    return items
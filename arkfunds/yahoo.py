@@ -61,21 +61,18 @@ class YahooFinance:
                 _data = _json[0]["quote"]
 
                 self._quote.append(
-                    {
-                        "ticker": _data.get("symbol"),
-                        "currency": _data.get("currency"),
-                        "price": _data.get("regularMarketPrice"),
-                        "change": _data.get("regularMarketChange"),
-                        "changep": _data.get("regularMarketChangePercent"),
-                        "last_trade": datetime.utcfromtimestamp(
-                            _data.get("regularMarketTime")
-                        ),
-                        "exchange": _data.get("exchange"),
-                    }
+                    (
+                        _data.get("symbol"),
+                        _data.get("currency"),
+                        _data.get("regularMarketPrice"),
+                        _data.get("regularMarketChange"),
+                        _data.get("regularMarketChangePercent"),
+                        datetime.utcfromtimestamp(_data.get("regularMarketTime")),
+                        _data.get("exchange"),
+                    )
                 )
 
     def price_history(self, days_back, frequency):
-        df = pd.DataFrame(columns=self._COLUMNS["price_history"])
         dataframes = []
         dt = timedelta(days=days_back)
         frequency = {"m": "mo", "w": "wk", "d": "d"}[frequency]
@@ -101,15 +98,17 @@ class YahooFinance:
                 df.columns = self._COLUMNS["price_history"]
                 dataframes.append(df)
 
-        if df.empty:
+        if not dataframes:
             return f"Stock.price_history: No data found for {self.symbols}"
+        elif len(dataframes) == 1:
+            return dataframes[0]
         else:
-            return pd.concat(dataframes, axis=0).reset_index(drop=True)
+            return pd.concat(dataframes, axis=0, copy=False).reset_index(drop=True)
 
     @property
     def price(self):
         self._update_quote()
-        df = pd.DataFrame(self._quote, columns=self._COLUMNS["price"])
+        df = pd.DataFrame.from_records(self._quote, columns=self._COLUMNS["price"])
 
         if df.empty:
             return f"Stock.price: No data found for {self.symbols}"
@@ -0,0 +1,134 @@
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from arkfunds.arkfunds import ArkFunds
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering requests from a handler instead of the network"""
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.urls = []
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        self.requests.append(request)
+
+        url = urlparse(request.url)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        status, payload = self.handler(url.path, query)
+
+        res = requests.Response()
+        res.status_code = status
+        if hasattr(payload, "read"):
+            # A file-like payload is served as an unsized, unread body
+            res.raw = payload
+        else:
+            if not isinstance(payload, bytes):
+                payload = json.dumps(payload).encode()
+            res._content = payload
+            res.headers["Content-Length"] = str(len(payload))
+            res.raw = io.BytesIO(payload)
+        res.url = request.url
+        res.request = request
+
+        return res
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Route ArkFunds requests to a handler ``(path, query) -> (status, payload)``
+
+    The payload is served as JSON, unless it is raw bytes or a file-like body.
+
+    Instances must be created after the handler is installed, since they pick
+    up the shared session on initialization.
+    """
+
+    def install(handler):
+        adapter = FakeAdapter(handler)
+        session = requests.Session()
+        session.mount("https://", adapter)
+
+        monkeypatch.setattr(ArkFunds, "_SESSION", session)
+        monkeypatch.setattr(ArkFunds, "_CACHE", {})
+        monkeypatch.setattr(ArkFunds, "_BATCH_SUPPORT", {})
+
+        return adapter
+
+    return install
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """Answer requests from the server's handler, over a real socket"""
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        status, payload = self.server.handler(url.path, query)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+
+        if isinstance(payload, (dict, list, bytes)):
+            if not isinstance(payload, bytes):
+                payload = json.dumps(payload).encode()
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        else:
+            # Any other iterable is sent chunk by chunk until the connection closes
+            self.end_headers()
+            for chunk in payload:
+                self.wfile.write(chunk)
+                self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_api(monkeypatch):
+    """Serve ArkFunds requests from a handler on a local HTTP server
+
+    Unlike ``fake_api`` this goes over the network stack, so it also reaches
+    the aiohttp path.
+    """
+    servers = []
+
+    def install(handler):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler)
+        server.handler = handler
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        servers.append(server)
+
+        for name in ("HTTP_PROXY", "http_proxy", "ALL_PROXY", "all_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(
+            ArkFunds, "BASE_URL", f"http://127.0.0.1:{server.server_port}/api/v1"
+        )
+        monkeypatch.setattr(ArkFunds, "_CACHE", {})
+        monkeypatch.setattr(ArkFunds, "_BATCH_SUPPORT", {})
+
+        return server
+
+    yield install
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,250 @@
+import io
+import time
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from arkfunds import arkfunds
+from arkfunds.arkfunds import ArkFunds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("arkfunds.arkfunds.time.monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def api(fake_api):
+    return fake_api(lambda path, query: (200, {"symbol": query["symbol"]}))
+
+
+def test_cache_reused_within_ttl(api, clock):
+    ark = ArkFunds("ARKK")
+
+    ark._get("etf", "profile", {}, "ARKK")
+    clock[0] += ArkFunds.CACHE_TTL - 1
+    ark._get("etf", "profile", {}, "ARKK")
+
+    assert len(api.urls) == 1
+
+
+def test_cache_refetched_after_ttl(api, clock):
+    ark = ArkFunds("ARKK")
+
+    ark._get("etf", "profile", {}, "ARKK")
+    clock[0] += ArkFunds.CACHE_TTL
+    ark._get("etf", "profile", {}, "ARKK")
+
+    assert len(api.urls) == 2
+
+
+def test_cache_prunes_stale_entries(api, clock):
+    ark = ArkFunds("ARKK")
+
+    ark._get("etf", "profile", {}, "ARKK")
+    clock[0] += ArkFunds.CACHE_TTL
+    ark._get("etf", "profile", {}, "ARKF")
+
+    assert [key[2] for key in ArkFunds._CACHE] == [(("symbol", "ARKF"),)]
+
+
+def test_cache_disabled(api, monkeypatch):
+    monkeypatch.setattr(ArkFunds, "CACHE_TTL", 0)
+    ark = ArkFunds("ARKK")
+
+    ark._get("etf", "profile", {}, "ARKK")
+    ark._get("etf", "profile", {}, "ARKK")
+
+    assert len(api.urls) == 2
+    assert not ArkFunds._CACHE
+
+
+def test_clear_cache(api):
+    ark = ArkFunds("ARKK")
+
+    ark._get("etf", "profile", {}, "ARKK")
+    ArkFunds.clear_cache()
+    ark._get("etf", "profile", {}, "ARKK")
+
+    assert len(api.urls) == 2
+
+
+def test_get_all_matches_single_requests(fake_api):
+    api = fake_api(lambda path, query: (200, {"symbol": query["symbol"]}))
+    ark = ArkFunds("ARKK")
+    query = {"period": "1m", "date": None}
+
+    ark._get_all("etf", "trades", query, ["ARKK", "ARKF"])
+    ArkFunds.clear_cache()
+    ark._get("etf", "trades", query, "ARKK")
+    ark._get("etf", "trades", query, "ARKF")
+
+    assert sorted(api.urls[:2]) == sorted(api.urls[2:])
+
+
+def test_get_all_sends_current_cookies(fake_api):
+    api = fake_api(lambda path, query: (200, {"symbol": query["symbol"]}))
+    ark = ArkFunds("ARKK")
+    template = ark._prepare("etf", "trades", {})
+    ark.session.cookies.set("session", "abc", domain="arkfunds.io")
+
+    ark._get("etf", "trades", {}, "ARKK", template=template)
+
+    assert api.requests[0].headers["Cookie"] == "session=abc"
+
+
+class _BrokenBody(io.BytesIO):
+    def __init__(self, error):
+        super().__init__(b'{"trades": [')
+        self.error = error
+
+    def read(self, *args):
+        if self.tell():
+            raise self.error
+        return super().read(*args)
+
+    def readinto(self, buffer):
+        if self.tell():
+            raise self.error
+        return super().readinto(buffer)
+
+
+requires_ijson = pytest.mark.skipif(arkfunds.ijson is None, reason="requires ijson")
+
+
+@requires_ijson
+@pytest.mark.parametrize(
+    "body, error",
+    [
+        (_BrokenBody(ProtocolError("Connection broken")), requests.ConnectionError),
+        (_BrokenBody(ReadTimeoutError(None, None, "Read timed out")), requests.Timeout),
+        (io.BytesIO(b'{"trades": [{"fund": "ARKK"'), ValueError),
+    ],
+    ids=["protocol-error", "read-timeout", "truncated-json"],
+)
+def test_stream_errors(fake_api, body, error):
+    fake_api(lambda path, query: (200, body))
+    ark = ArkFunds("ARKK")
+
+    with pytest.raises(error):
+        ark._get("etf", "trades", {}, "ARKK")
+
+
+@requires_ijson
+def test_stream_matches_buffered(fake_api, monkeypatch):
+    payload = {
+        "symbol": "ARKK",
+        "date": "2021-07-22",
+        "holdings": [
+            {"ticker": "TSLA", "shares": 3924520, "weight": 10.54},
+            {"ticker": "SQ", "shares": None, "weight": 7.0},
+        ],
+    }
+    fake_api(lambda path, query: (200, payload))
+    ark = ArkFunds("ARKK")
+    monkeypatch.setattr(ArkFunds, "CACHE_TTL", 0)
+
+    monkeypatch.setattr(ArkFunds, "_STREAM_MIN_SIZE", float("inf"))
+    buffered = ark._get("etf", "holdings", {}, "ARKK")
+    monkeypatch.setattr(ArkFunds, "_STREAM_MIN_SIZE", 0)
+    streamed = ark._get("etf", "holdings", {}, "ARKK")
+
+    assert streamed == buffered == payload
+
+
+@requires_ijson
+@pytest.mark.parametrize(
+    "content_length, content_encoding, stream",
+    [
+        (None, None, True),
+        (16 * 1024, None, False),
+        (16 * 1024, "gzip", True),
+        (4 * 1024, "gzip", False),
+        (16 * 1024, "identity", False),
+    ],
+)
+def test_stream_threshold(content_length, content_encoding, stream):
+    ark = ArkFunds("ARKK")
+
+    assert ark._stream("holdings", content_length, content_encoding) is stream
+    assert not ark._stream("profile", content_length, content_encoding)
+
+
+def test_async_timeout_per_read(local_api, monkeypatch):
+    pytest.importorskip("aiohttp")
+
+    def drip():
+        for chunk in (b'{"symbol": ', b'"ARKK", ', b'"name": ', b'"ARK"}'):
+            time.sleep(0.1)
+            yield chunk
+
+    local_api(lambda path, query: (200, drip()))
+    monkeypatch.setattr(ArkFunds, "USE_ASYNC", True)
+    ark = ArkFunds("ARKK")
+    ark.timeout = 0.25
+
+    data = ark._get_all("etf", "profile", {}, ["ARKK", "ARKF"])
+
+    assert data == [{"symbol": "ARKK", "name": "ARK"}] * 2
+
+
+@pytest.fixture
+def async_api(local_api, monkeypatch):
+    pytest.importorskip("aiohttp")
+    monkeypatch.setattr(ArkFunds, "USE_ASYNC", True)
+    return local_api
+
+
+def test_async_matches_threads(async_api, monkeypatch):
+    async_api(lambda path, query: (200, {"symbol": query["symbol"]}))
+    ark = ArkFunds("ARKK")
+
+    data = ark._get_all("etf", "profile", {}, ["ARKK", "ARKF"])
+    ArkFunds.clear_cache()
+    monkeypatch.setattr(ArkFunds, "USE_ASYNC", False)
+
+    assert data == ark._get_all("etf", "profile", {}, ["ARKK", "ARKF"])
+    assert data == [{"symbol": "ARKK"}, {"symbol": "ARKF"}]
+
+
+def test_async_not_found(async_api):
+    async_api(lambda path, query: (404, {}))
+
+    assert ArkFunds("ARKK")._get_all("etf", "profile", {}, ["ARKK"]) == [None]
+
+
+def test_async_http_error(async_api):
+    async_api(lambda path, query: (422, {}))
+    ark = ArkFunds("ARKK")
+
+    with pytest.raises(requests.HTTPError) as excinfo:
+        ark._get_all("etf", "profile", {}, ["ARKK"])
+
+    assert excinfo.value.response.status_code == 422
+    assert excinfo.value.response.url.startswith(ArkFunds.BASE_URL)
+
+
+def test_async_connection_error(async_api, monkeypatch):
+    server = async_api(lambda path, query: (200, {}))
+    server.shutdown()
+    server.server_close()
+    ark = ArkFunds("ARKK")
+
+    with pytest.raises(requests.ConnectionError):
+        ark._get_all("etf", "profile", {}, ["ARKK"])
+
+
+def test_async_timeout(async_api):
+    def stall():
+        time.sleep(0.5)
+        yield b"{}"
+
+    async_api(lambda path, query: (200, stall()))
+    ark = ArkFunds("ARKK")
+    ark.timeout = 0.1
+
+    with pytest.raises(requests.Timeout):
+        ark._get_all("etf", "profile", {}, ["ARKK"])
@@ -46,3 +46,97 @@ def test_etf_symbols_list():
         etf = ETF(symbol)
 
     assert etf.symbols == ["ARKK", "ARKF", "ARKG", "ARKX", "IZRL"]
+
+
+def _etf_trades_handler(batch):
+    def handler(path, query):
+        symbols = query["symbol"].split(",")
+        if len(symbols) > 1:
+            return batch(symbols)
+        return 200, {"symbol": symbols[0], "trades": [{"ticker": "TSLA"}]}
+
+    return handler
+
+
+def test_etf_trades_batched(fake_api):
+    api = fake_api(
+        _etf_trades_handler(
+            lambda symbols: (200, {"trades": [{"fund": s} for s in symbols]})
+        )
+    )
+
+    df = ETF("arkk, arkf").trades()
+
+    assert df["fund"].tolist() == ["ARKK", "ARKF"]
+    assert len(api.urls) == 1
+
+
+@pytest.mark.parametrize(
+    "batch, requests",
+    [
+        (lambda symbols: (200, {"trades": []}), 3),
+        (lambda symbols: (200, {"trades": [{"fund": symbols[0]}]}), 2),
+        (lambda symbols: (400, {}), 3),
+        (lambda symbols: (422, {}), 3),
+    ],
+    ids=["empty", "first-symbol-only", "400", "422"],
+)
+def test_etf_trades_batch_fallback(fake_api, batch, requests):
+    api = fake_api(_etf_trades_handler(batch))
+
+    df = ETF("arkk, arkf").trades()
+
+    assert df["fund"].tolist() == ["ARKK", "ARKF"]
+    assert len(api.urls) == requests
+
+
+def test_etf_trades_batch_partial(fake_api):
+    api = fake_api(
+        _etf_trades_handler(
+            # ARKF made no trades
+            lambda symbols: (
+                200,
+                {"trades": [{"fund": s} for s in symbols if s != "ARKF"]},
+            )
+        )
+    )
+
+    df = ETF("arkk, arkf, arkg").trades()
+
+    assert df["fund"].tolist() == ["ARKK", "ARKG"]
+    assert len(api.urls) == 1
+
+    ETF.clear_cache()
+    df = ETF("arkk, arkf").trades(period="1m")
+
+    assert df["fund"].tolist() == ["ARKK"]
+    assert len(api.urls) == 2
+
+
+def test_etf_trades_batch_rejection_remembered(fake_api):
+    api = fake_api(_etf_trades_handler(lambda symbols: (422, {})))
+
+    ETF("arkk, arkf").trades()
+    ETF.clear_cache()
+    ETF("arkk, arkf").trades()
+
+    assert len(api.urls) == 5
+
+
+def test_etf_holdings_batched_date(fake_api):
+    fake_api(
+        lambda path, query: (
+            200,
+            {
+                "date": "2021-07-22",
+                "holdings": [
+                    {"fund": "ARKK", "ticker": "TSLA"},
+                    {"fund": "ARKF", "ticker": "SQ", "date": "2021-07-21"},
+                ],
+            },
+        )
+    )
+
+    df = ETF("arkk, arkf").holdings()
+
+    assert df["date"].dt.strftime("%Y-%m-%d").tolist() == ["2021-07-22", "2021-07-21"]
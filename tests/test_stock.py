@@ -69,3 +69,32 @@ def test_stock_symbols_list():
     for symbol in symbols:
         stock = Stock(symbol)
     assert stock.symbols == ["TSLA", "AAPL", "TDOC"]
+
+
+def test_stock_symbols_duplicates():
+    stock = Stock("tsla, TSLA aapl tdoc aapl")
+    assert stock.symbols == ["TSLA", "AAPL", "TDOC"]
+
+
+@pytest.mark.parametrize(
+    "batch, requests",
+    [
+        (lambda symbols: (200, {"trades": []}), 3),
+        (lambda symbols: (200, {"trades": [{"ticker": symbols[0]}]}), 2),
+        (lambda symbols: (422, {}), 3),
+    ],
+    ids=["empty", "first-symbol-only", "422"],
+)
+def test_stock_trades_batch_fallback(fake_api, batch, requests):
+    def handler(path, query):
+        symbols = query["symbol"].split(",")
+        if len(symbols) > 1:
+            return batch(symbols)
+        return 200, {"trades": [{"ticker": symbols[0]}]}
+
+    api = fake_api(handler)
+
+    df = Stock("tsla, coin").trades()
+
+    assert df["ticker"].tolist() == ["TSLA", "COIN"]
+    assert len(api.urls) == requests
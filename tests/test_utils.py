@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+import requests
+
+from arkfunds.utils import _convert_to_list, _encode_query
+
+
+@pytest.mark.parametrize(
+    "symbols, expected",
+    [
+        ("tsla,coin", ["TSLA", "COIN"]),
+        ("tsla, coin", ["TSLA", "COIN"]),
+        ("roku SHOP tsla", ["ROKU", "SHOP", "TSLA"]),
+        ("brk.b tsla", ["BRK.B", "TSLA"]),
+        ("brk-b, ^gspc", ["BRK-B", "^GSPC"]),
+        ("tsla\tcoin\nspot", ["TSLA", "COIN", "SPOT"]),
+        ("", []),
+        (["tsla", "coin"], ["TSLA", "COIN"]),
+    ],
+)
+def test_convert_to_list(symbols, expected):
+    assert _convert_to_list(symbols) == expected
+
+
+def test_convert_to_list_comma_split():
+    assert _convert_to_list("tsla, brk b", comma_split=True) == ["TSLA", "BRK B"]
+
+
+def test_encode_query():
+    query = {
+        "symbol": "ARKK",
+        "date": date(2021, 8, 20),
+        "limit": 10,
+        "direction": None,
+        "fund": ["ARKK", None, "ARKF"],
+    }
+
+    assert _encode_query(query) == [
+        ("symbol", "ARKK"),
+        ("date", "2021-08-20"),
+        ("limit", "10"),
+        ("fund", "ARKK"),
+        ("fund", "ARKF"),
+    ]
+
+
+def test_encode_query_matches_requests():
+    query = {"date_from": date(2021, 1, 1), "direction": [None], "symbol": "A,B"}
+    prepared = requests.Request("GET", "https://x.test/", params=query).prepare()
+
+    encoded = requests.Request(
+        "GET", "https://x.test/", params=_encode_query(query)
+    ).prepare()
+
+    assert encoded.url == prepared.url